@@ -2,16 +2,59 @@ import pandas as pd
 import numpy as np
 from tabulate import tabulate
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from python_calamine import CalamineWorkbook
+
+# Integer codes for the 'type' rule, resolved once per validation run
+TYPE_NONE, TYPE_EMAIL, TYPE_PHONE, TYPE_NUMERIC = range(4)
+TYPE_KINDS = {'email': TYPE_EMAIL, 'phone': TYPE_PHONE, 'numeric': TYPE_NUMERIC}
+
+# Compiled once at import for the scalar validate_email/validate_phone helpers only.
+# Column validation matches with _ARROW_PATTERNS below; keep the two in sync.
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+
+# The patterns validation actually uses, for Arrow's RE2-based str.match. RE2's \w and \d are
+# ASCII-only, so explicit Unicode classes keep them accepting what the re patterns above accept
+# (e.g. 'ü@ex.com').
+_ARROW_PATTERNS = {
+    TYPE_EMAIL: r'^[\p{L}\p{N}_.-]+@[\p{L}\p{N}_.-]+\.[\p{L}\p{N}_]+$',
+    TYPE_PHONE: r'^\+?1?\p{Nd}{9,15}$'
+}
+
+# Above this many errors the grid table gets too large to build; fall back to a truncated plain listing
+MAX_GRID_ROWS = 100
+
+# Rows turned into a DataFrame and validated at once by validate_file
+CHUNK_SIZE = 100_000
+
+def _normalize_cell(value):
+    """Convert a raw calamine cell the way read_excel does, so every chunk sees the same values"""
+    if value == '':
+        return None
+    # Whole numbers arrive as floats; without this a phone like 1234567890 becomes '1234567890.0'
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
 
 class ExcelValidator:
     def __init__(self):
-        self.validation_results = []
         self.df = None
+        # Errors are kept as parallel columns rather than a list of dicts
+        self._rows, self._cols, self._vals, self._errs = [], [], [], []
 
-    def load_excel(self, file_path):
-        """Load the Excel file into a pandas DataFrame"""
+    def load_excel(self, file_path, columns=None):
+        """Load the Excel file into a pandas DataFrame, keeping only the given columns if any"""
         try:
-            self.df = pd.read_excel(file_path)
+            usecols = None
+            if columns is not None:
+                # A callable usecols lets missing columns through to validation instead of raising
+                wanted = set(columns)
+                usecols = lambda column: column in wanted
+            # Arrow-backed columns let the regex checks run on Arrow's compiled string kernels.
+            # Columns mixing text and numbers load as strings, so their error values display as '150' rather than 150.
+            self.df = pd.read_excel(file_path, engine='calamine', usecols=usecols, dtype_backend='pyarrow')
             print(f"Successfully loaded Excel file with {len(self.df)} rows")
             return True
         except Exception as e:
@@ -20,105 +63,197 @@ class ExcelValidator:
 
     def validate_email(self, email):
         """Validate email format"""
-        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        return bool(re.match(pattern, str(email)))
+        return bool(_EMAIL_RE.match(str(email)))
 
     def validate_phone(self, phone):
         """Validate phone number format"""
-        pattern = r'^\+?1?\d{9,15}$'
-        return bool(re.match(pattern, str(phone)))
+        return bool(_PHONE_RE.match(str(phone)))
+
+    @property
+    def validation_results(self):
+        """Validation errors as a list of dicts"""
+        return [
+            {'Row': row, 'Column': column, 'Value': value, 'Error': error}
+            for row, column, value, error in zip(self._rows, self._cols, self._vals, self._errs)
+        ]
+
+    def results_frame(self):
+        """Validation errors as a DataFrame"""
+        return pd.DataFrame({'Row': self._rows, 'Column': self._cols, 'Value': self._vals, 'Error': self._errs})
+
+    def _add_error(self, row, column, value, error):
+        """Record a single validation error"""
+        self._rows.append(row)
+        self._cols.append(column)
+        self._vals.append(value)
+        self._errs.append(error)
+
+    def _add_errors(self, errors, column, values, mask, message):
+        """Append an error to the (rows, cols, vals, errs) lists for every row flagged in the boolean mask"""
+        rows, cols, vals, errs = errors
+        positions = np.flatnonzero(mask)
+        # The index holds each row's position in the sheet, also for chunks streamed by validate_file.
+        # Adding 2 because Excel rows start at 1 and header is row 1
+        rows.extend((values.index.to_numpy()[positions] + 2).tolist())
+        cols.extend([column] * len(positions))
+        vals.extend(values.iloc[positions].tolist())
+        errs.extend([message] * len(positions))
+
+    def _match_column(self, col, type_kind):
+        """Return a bool array marking the cells that fully match the email or phone pattern"""
+        # Going through Python objects keeps whole numbers as '1234567890'; casting an Arrow int column
+        # with nulls straight to string gives '1234567890.0'
+        strings = col.astype(object).astype('string[pyarrow]')
+        return strings.str.match(_ARROW_PATTERNS[type_kind], na=False).to_numpy(dtype=bool)
+
+    def compile_rules(self, rules):
+        """Turn the rules dict into a plan of per-column checks, reporting missing columns once"""
+        known_columns = set(self.df.columns)
+        plan = []
+
+        for column, rule in rules.items():
+            if column not in known_columns:
+                # Reported on the header row, where the column should have been
+                self._add_error(1, column, 'N/A', 'Column not found in Excel file')
+                continue
+
+            allowed_values = rule.get('allowed_values')
+            plan.append((
+                column,
+                bool(rule.get('required', False)),
+                TYPE_KINDS.get(rule.get('type'), TYPE_NONE),
+                rule.get('min'),
+                rule.get('max'),
+                frozenset(allowed_values) if allowed_values is not None else None,
+                allowed_values  # Original list, kept for error messages
+            ))
+
+        return plan
+
+    def _check_column(self, column, required, type_kind, minimum, maximum, allowed_set, allowed_values):
+        """Run one compiled rule against its whole column and return its own error lists"""
+        errors = ([], [], [], [])
+        col = self.df[column]
+        # Masks and numbers are plain NumPy arrays so every check below stays out of pandas' wrappers
+        na_mask = col.isna().to_numpy()
+        present = ~na_mask
+
+        # Convert once; feeds both the numeric type check and the range checks
+        numeric = None
+        if type_kind == TYPE_NUMERIC or minimum is not None or maximum is not None:
+            numeric = pd.to_numeric(col, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+        # Check if required; empty cells are skipped by every other check
+        if required:
+            self._add_errors(errors, column, col, na_mask, 'Required field is empty')
+
+        # Type validation
+        if type_kind == TYPE_EMAIL:
+            invalid = ~self._match_column(col, TYPE_EMAIL) & present
+            self._add_errors(errors, column, col, invalid, 'Invalid email format')
+        elif type_kind == TYPE_PHONE:
+            invalid = ~self._match_column(col, TYPE_PHONE) & present
+            self._add_errors(errors, column, col, invalid, 'Invalid phone number format')
+        elif type_kind == TYPE_NUMERIC:
+            invalid = np.isnan(numeric) & present
+            self._add_errors(errors, column, col, invalid, 'Not a valid number')
+
+        # Range validation
+        if minimum is not None:
+            self._add_errors(errors, column, col, numeric < minimum,
+                             f'Value below minimum ({minimum})')
+        if maximum is not None:
+            self._add_errors(errors, column, col, numeric > maximum,
+                             f'Value above maximum ({maximum})')
+
+        # List validation
+        if allowed_set is not None:
+            # Compare as Python objects, like the original `value in list`; Arrow's is_in raises
+            # when the column's type (e.g. string or null) differs from the allowed values'
+            invalid = ~col.astype(object).isin(allowed_set).to_numpy(dtype=bool) & present
+            self._add_errors(errors, column, col, invalid,
+                             f'Value not in allowed list: {allowed_values}')
+
+        return errors
+
+    def _run_plan(self, plan):
+        """Check the loaded DataFrame against a compiled plan, appending to the error lists"""
+        if not plan:
+            return
+
+        # Columns are independent and the string/numeric kernels release the GIL, so check them in parallel.
+        # map() yields results in rule order, keeping the output independent of thread scheduling.
+        with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+            for rows, cols, vals, errs in executor.map(lambda check: self._check_column(*check), plan):
+                self._rows.extend(rows)
+                self._cols.extend(cols)
+                self._vals.extend(vals)
+                self._errs.extend(errs)
+
+    def _sort_results(self):
+        """Reorder the error lists by row; the stable sort keeps each row's errors in rule order"""
+        order = np.argsort(np.asarray(self._rows, dtype=np.int64), kind='stable').tolist()
+        self._rows, self._cols, self._vals, self._errs = (
+            [values[i] for i in order] for values in (self._rows, self._cols, self._vals, self._errs)
+        )
 
     def validate_data(self, rules):
-        """Validate data based on specified rules"""
-        self.validation_results = []
-        
-        for index, row in self.df.iterrows():
-            row_number = index + 2  # Adding 2 because Excel rows start at 1 and header is row 1
-            
-            for column, rule in rules.items():
-                if column not in self.df.columns:
-                    self.validation_results.append({
-                        'Row': row_number,
-                        'Column': column,
-                        'Value': 'N/A',
-                        'Error': 'Column not found in Excel file'
-                    })
-                    continue
-
-                value = row[column]
-                
-                # Check if required
-                if rule.get('required', False) and pd.isna(value):
-                    self.validation_results.append({
-                        'Row': row_number,
-                        'Column': column,
-                        'Value': value,
-                        'Error': 'Required field is empty'
-                    })
-                    continue
-
-                # Skip further validation if value is empty and not required
-                if pd.isna(value):
-                    continue
-
-                # Type validation
-                if 'type' in rule:
-                    if rule['type'] == 'email' and not self.validate_email(value):
-                        self.validation_results.append({
-                            'Row': row_number,
-                            'Column': column,
-                            'Value': value,
-                            'Error': 'Invalid email format'
-                        })
-                    elif rule['type'] == 'phone' and not self.validate_phone(value):
-                        self.validation_results.append({
-                            'Row': row_number,
-                            'Column': column,
-                            'Value': value,
-                            'Error': 'Invalid phone number format'
-                        })
-                    elif rule['type'] == 'numeric' and not str(value).replace('.', '').isdigit():
-                        self.validation_results.append({
-                            'Row': row_number,
-                            'Column': column,
-                            'Value': value,
-                            'Error': 'Not a valid number'
-                        })
-
-                # Range validation
-                if 'min' in rule and float(value) < rule['min']:
-                    self.validation_results.append({
-                        'Row': row_number,
-                        'Column': column,
-                        'Value': value,
-                        'Error': f'Value below minimum ({rule["min"]})'
-                    })
-                if 'max' in rule and float(value) > rule['max']:
-                    self.validation_results.append({
-                        'Row': row_number,
-                        'Column': column,
-                        'Value': value,
-                        'Error': f'Value above maximum ({rule["max"]})'
-                    })
-
-                # List validation
-                if 'allowed_values' in rule and value not in rule['allowed_values']:
-                    self.validation_results.append({
-                        'Row': row_number,
-                        'Column': column,
-                        'Value': value,
-                        'Error': f'Value not in allowed list: {rule["allowed_values"]}'
-                    })
+        """Validate data based on specified rules, checking columns in parallel"""
+        self._rows, self._cols, self._vals, self._errs = [], [], [], []
+        self._run_plan(self.compile_rules(rules))
+        self._sort_results()
+
+    def validate_file(self, file_path, rules, chunk_size=CHUNK_SIZE):
+        """Validate the first sheet of an Excel file in row chunks, so DataFrames and masks only ever cover one chunk"""
+        self._rows, self._cols, self._vals, self._errs = [], [], [], []
+        total_rows = 0
+
+        try:
+            # Calamine still loads the sheet's raw cell range up front; iter_rows only walks it
+            sheet_rows = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0).iter_rows()
+            header = next(sheet_rows, [])
+            positions = [i for i, name in enumerate(header) if name in rules]
+            columns = [header[i] for i in positions]
+
+            # Rules are compiled once against the header so missing columns are reported only once
+            self.df = pd.DataFrame(columns=columns)
+            plan = self.compile_rules(rules)
+
+            while True:
+                chunk = list(islice(sheet_rows, chunk_size))
+                if not chunk:
+                    break
+                # Chunks stay object dtype: inferring column types per chunk would make results depend on chunk_size
+                self.df = pd.DataFrame(
+                    [[_normalize_cell(row[i]) for i in positions] for row in chunk],
+                    columns=columns,
+                    index=range(total_rows, total_rows + len(chunk)),
+                    dtype=object
+                )
+                self._run_plan(plan)
+                total_rows += len(chunk)
+        except Exception as e:
+            print(f"Error loading file: {str(e)}")
+            return False
+        finally:
+            self.df = None
+
+        print(f"Successfully validated Excel file with {total_rows} rows")
+        self._sort_results()
+        return True
 
     def display_results(self):
         """Display validation results in a table format"""
-        if not self.validation_results:
+        if not self._rows:
             print("\nNo validation errors found! ✅")
             return
 
         print("\nValidation Errors Found:")
-        print(tabulate(self.validation_results, headers='keys', tablefmt='grid'))
-        print(f"\nTotal errors found: {len(self.validation_results)}")
+        if len(self._rows) > MAX_GRID_ROWS:
+            print(self.results_frame().to_string(index=False, max_rows=MAX_GRID_ROWS))
+        else:
+            print(tabulate(self.results_frame(), headers='keys', tablefmt='grid', showindex=False))
+        print(f"\nTotal errors found: {len(self._rows)}")
 
 def main():
     # Example validation rules
@@ -148,8 +283,7 @@ def main():
     # Get file path from user
     file_path = input("Please enter the path to your Excel file: ")
     
-    if validator.load_excel(file_path):
-        validator.validate_data(validation_rules)
+    if validator.validate_file(file_path, validation_rules):
         validator.display_results()
 
 if __name__ == "__main__":
@@ -1,72 +1,167 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import io
+import re
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: compiles the price/tax checks to native code
+    njit = None
+
+PRICE_COLUMNS = ['MAP', 'MRP (O)', 'Sale Price (inc tax)', 'Tax Rate']
+
+# Formatting stripped before numeric conversion, in one regex pass per column
+_PRICE_CLEAN_RE = re.compile(r'[,₹\s]')
+_TAX_CLEAN_RE = re.compile(r'[%\s]')
+
+# Bit flags returned per row by _price_flags
+DATA_ERROR, PRICE_ERROR, TAX_ERROR = 1, 2, 4
+
+def _price_flags_numpy(map_price, mrp, sale_price, tax_rate, data_err):
+    """Flag data, MAP vs MRP and tax errors for every row"""
+    expected_tax = np.where(sale_price > 999, 18, 12)
+    flags = np.where(data_err, DATA_ERROR, 0)
+    flags |= np.where(~data_err & (map_price >= mrp), PRICE_ERROR, 0)
+    flags |= np.where(~data_err & (np.trunc(tax_rate) != expected_tax), TAX_ERROR, 0)
+    return flags.astype(np.int8)
+
+if njit is not None:
+    # Streamlit re-executes this script on every rerun; cache=True reuses the compiled kernel from disk
+    @njit(parallel=True, cache=True)
+    def _price_flags_numba(map_price, mrp, sale_price, tax_rate, data_err):
+        """Flag data, MAP vs MRP and tax errors for every row in one fused native loop"""
+        flags = np.zeros(map_price.shape[0], dtype=np.int8)
+        for i in prange(map_price.shape[0]):
+            if data_err[i]:
+                flags[i] = DATA_ERROR
+                continue
+            # Blank prices are NaN and compare False, so they never raise a price error
+            if map_price[i] >= mrp[i]:
+                flags[i] |= PRICE_ERROR
+            expected_tax = 18 if sale_price[i] > 999 else 12
+            if np.trunc(tax_rate[i]) != expected_tax:
+                flags[i] |= TAX_ERROR
+        return flags
+
+    _price_flags = _price_flags_numba
+else:
+    _price_flags = _price_flags_numpy
+
+# Bounded so uploads from every session don't pile up in server memory
+@st.cache_data(show_spinner=False, max_entries=4)
+def _parse_excel(raw):
+    """Parse uploaded Excel bytes, cached by Streamlit on the bytes so reruns skip re-parsing"""
+    # Only the price/tax columns are validated; read them as text and clean them ourselves
+    return pd.read_excel(
+        io.BytesIO(raw),
+        engine='calamine',
+        usecols=lambda column: column in PRICE_COLUMNS,
+        dtype={column: str for column in PRICE_COLUMNS}
+    )
 
 class EcommerceValidator:
     def __init__(self):
         self.df = None
-        self.errors = []
+        # Errors are kept as parallel columns rather than a list of dicts
+        self._rows, self._types, self._errs = [], [], []
         self.summary = {}
 
+    @property
+    def errors(self):
+        """Validation errors as a list of dicts"""
+        return [
+            {'Row': row, 'Type': error_type, 'Error': error}
+            for row, error_type, error in zip(self._rows, self._types, self._errs)
+        ]
+
+    def errors_frame(self):
+        """Validation errors as a DataFrame"""
+        return pd.DataFrame({'Row': self._rows, 'Type': self._types, 'Error': self._errs})
+
+    def _add_error(self, row_num, error_type, error):
+        """Record a single validation error"""
+        self._rows.append(row_num)
+        self._types.append(error_type)
+        self._errs.append(error)
+
     def load_excel(self, uploaded_file):
         try:
-            self.df = pd.read_excel(uploaded_file)
+            self.df = _parse_excel(uploaded_file.getvalue())
             return True
         except Exception as e:
             st.error(f"Error loading file: {str(e)}")
             return False
 
+    def _numeric_column(self, column, strip_pattern):
+        """Strip formatting characters from a whole column and convert it to floats, flagging unparseable cells"""
+        if column not in self.df.columns:
+            return np.full(len(self.df), np.nan), np.ones(len(self.df), dtype=bool)
+        cleaned = self.df[column].astype(str).str.replace(strip_pattern, '', regex=True)
+        values = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=float)
+        # Blank cells come through as 'nan' and stay NaN, as float('nan') did; anything else that fails is bad data
+        unparseable = np.isnan(values) & (cleaned.str.lower() != 'nan').to_numpy()
+        return values, unparseable
+
+    def _data_error(self, bad, index):
+        """Describe the first unparseable value in a row"""
+        for column, flags in bad.items():
+            if not flags[index]:
+                continue
+            if column not in self.df.columns:
+                return f"Invalid data in row: column '{column}' not found"
+            return f"Invalid data in row: {column} value {self.df[column].iat[index]!r} is not a valid number"
+
     def validate_prices_and_tax(self):
-        """Validate MAP vs MRP and tax rates row by row"""
-        for index, row in self.df.iterrows():
-            row_num = index + 2  # Excel row numbers start at 1 and header is row 1
-            
-            try:
-                # Clean and convert price values
-                map_price = float(str(row['MAP']).replace(',', '').replace('₹', '').strip())
-                mrp = float(str(row['MRP (O)']).replace(',', '').replace('₹', '').strip())
-                sale_price = float(str(row['Sale Price (inc tax)']).replace(',', '').replace('₹', '').strip())
-                
-                # Handle tax rate format (both 18% and 0.18 formats)
-                tax_str = str(row['Tax Rate']).replace('%', '').strip()
-                tax_rate = float(tax_str)
-                if tax_rate < 1:  # If tax is in decimal format (0.18)
-                    tax_rate = tax_rate * 100  # Convert to percentage (18)
-
-                # Check MAP vs MRP only
-                if map_price >= mrp:
-                    self.errors.append({
-                        'Row': row_num,
-                        'Type': 'Price Error',
-                        'Error': f"MAP (₹{map_price:,.2f}) is greater than or equal to MRP (₹{mrp:,.2f})"
-                    })
-
-                # Check Tax Rate
-                expected_tax = 18 if sale_price > 999 else 12
-                if int(tax_rate) != expected_tax:  # Convert to int to ignore decimal places
-                    self.errors.append({
-                        'Row': row_num,
-                        'Type': 'Tax Error',
-                        'Error': f"Incorrect tax rate {int(tax_rate)}% for Sale Price ₹{sale_price:,.2f} (should be {expected_tax}%)"
-                    })
-
-            except Exception as e:
-                self.errors.append({
-                    'Row': row_num,
-                    'Type': 'Data Error',
-                    'Error': f"Invalid data in row: {str(e)}"
-                })
+        """Validate MAP vs MRP and tax rates for all rows at once, recording errors in row order"""
+        # Clean and convert price values; blank prices stay NaN, which never compares as an error
+        map_price, map_bad = self._numeric_column('MAP', _PRICE_CLEAN_RE)
+        mrp, mrp_bad = self._numeric_column('MRP (O)', _PRICE_CLEAN_RE)
+        sale_price, sale_bad = self._numeric_column('Sale Price (inc tax)', _PRICE_CLEAN_RE)
+
+        # Handle tax rate format (both 18% and 0.18 formats)
+        tax_rate, _ = self._numeric_column('Tax Rate', _TAX_CLEAN_RE)
+        tax_rate = np.where(tax_rate < 1, tax_rate * 100, tax_rate)
+
+        # Unparseable prices are data errors, and so is any tax rate that can't be truncated to a whole percent (blank included)
+        bad = {'MAP': map_bad, 'MRP (O)': mrp_bad, 'Sale Price (inc tax)': sale_bad, 'Tax Rate': ~np.isfinite(tax_rate)}
+        data_err = map_bad | mrp_bad | sale_bad | bad['Tax Rate']
+
+        # Check MAP vs MRP and the tax rate (truncated to ignore decimal places) for every row
+        flags = _price_flags(map_price, mrp, sale_price, tax_rate, data_err)
+
+        for index in np.flatnonzero(flags):
+            row_num = int(index) + 2  # Excel row numbers start at 1 and header is row 1
+
+            if flags[index] & DATA_ERROR:
+                self._add_error(row_num, 'Data Error', self._data_error(bad, index))
+                continue
+
+            if flags[index] & PRICE_ERROR:
+                self._add_error(
+                    row_num,
+                    'Price Error',
+                    f"MAP (₹{map_price[index]:,.2f}) is greater than or equal to MRP (₹{mrp[index]:,.2f})"
+                )
+
+            if flags[index] & TAX_ERROR:
+                expected_tax = 18 if sale_price[index] > 999 else 12
+                self._add_error(
+                    row_num,
+                    'Tax Error',
+                    f"Incorrect tax rate {int(tax_rate[index])}% for Sale Price ₹{sale_price[index]:,.2f} (should be {expected_tax}%)"
+                )
 
     def validate(self):
         """Run all validations"""
-        self.errors = []  # Reset errors
+        self._rows, self._types, self._errs = [], [], []  # Reset errors
         
         # Validate prices and tax
         self.validate_prices_and_tax()
 
         # Prepare summary
         total_rows = len(self.df)
-        invalid_rows = len(set(error['Row'] for error in self.errors))
+        invalid_rows = int(np.unique(np.asarray(self._rows, dtype=np.int64)).size)
         
         self.summary = {
             'Total Rows': total_rows,
@@ -156,10 +251,9 @@ def main():
                 # Run validation
                 validator.validate()
 
-                if validator.errors:
+                errors_df = validator.errors_frame()
+                if not errors_df.empty:
                     st.error("❌ Validation Errors Found:")
-                    errors_df = pd.DataFrame(validator.errors)
-                    errors_df = errors_df.sort_values('Row')
                     
                     # Style the error dataframe
                     st.dataframe(
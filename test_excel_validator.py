@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from excel_validator import ExcelValidator
+
+RULES = {
+    'Email': {'required': True, 'type': 'email'},
+    'Phone': {'required': True, 'type': 'phone'},
+    'Age': {'required': True, 'type': 'numeric', 'min': 0, 'max': 120},
+    'Status': {'required': True, 'allowed_values': ['Active', 'Inactive', 'Pending']},
+}
+
+
+@pytest.fixture
+def sheet(tmp_path):
+    path = tmp_path / 'people.xlsx'
+    pd.DataFrame({
+        'Email': ['a@ex.com', 'bad', 'ü@ex.com', None, 'c@ex.com', 'd@ex', 'e@ex.com', 'f@ex.com'],
+        'Phone': [1234567890, '+11234567890', 1234567890, None, '12', 1234567890, '+11234567890', 1234567890],
+        'Age': [30, 150, -5, 'abc', 40, None, 25, 50],
+        'Status': ['Active', None, None, 'Gone', None, 'Pending', None, 'Inactive'],
+    }).to_excel(path, index=False)
+    return path
+
+
+def errors(validator):
+    return list(zip(validator._rows, validator._cols, validator._errs))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 100])
+def test_validate_file_matches_validate_data_at_any_chunk_size(sheet, chunk_size):
+    loaded = ExcelValidator()
+    assert loaded.load_excel(sheet, columns=RULES)
+    loaded.validate_data(RULES)
+
+    streamed = ExcelValidator()
+    assert streamed.validate_file(sheet, RULES, chunk_size=chunk_size)
+
+    assert errors(streamed) == errors(loaded)
+    # Whole-number phones are valid wherever they sit; only '12' and the blank cell are flagged
+    assert [row for row, column, _ in errors(streamed) if column == 'Phone'] == [5, 6]